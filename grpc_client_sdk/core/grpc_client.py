@@ -24,18 +24,29 @@ class GrpcClient:
 
     DEFAULT_FALLBACK_PORTS = [50051, 50052, 50053]
 
-    def __init__(self, host: str, port: int, logger: Optional[Logger] = None):
+    DEFAULT_CHANNEL_OPTIONS = {
+        "grpc.max_send_message_length": 100 * 1024 * 1024,  # 100MB
+        "grpc.max_receive_message_length": 100 * 1024 * 1024,
+        # Larger HTTP/2 buffers and frames for bulk log transfers
+        "grpc.http2.write_buffer_size": 1 << 20,
+        "grpc.http2.max_frame_size": 1 << 20,
+    }
+
+    def __init__(self, host: str, port: int, logger: Optional[Logger] = None,
+                 channel_options: Optional[Dict[str, Any]] = None):
         """
         Initialize the gRPC client with the specified host and port.
         :param host: The hostname or IP address of the gRPC server.
         :param port: The port number of the gRPC server.
         :param logger: Optional logger instance for logging.
+        :param channel_options: Optional channel arguments overriding DEFAULT_CHANNEL_OPTIONS.
 
         If not provided, a default logger will be created.
         """
         self.host = host
         self.port = port
         self.logger = logger or get_logger('framework.grpc_client')
+        self.channel_options = {**self.DEFAULT_CHANNEL_OPTIONS, **(channel_options or {})}
         self.target = f"{self.host}:{self.port}"
         self.channel: Optional[grpc.Channel] = None
         self.stubs: Dict[str, Any] = {}
@@ -70,10 +81,7 @@ class GrpcClient:
                 self.logger.debug(f"Attempting to connect to {target}")
                 self.channel = grpc.insecure_channel(
                     self.target,
-                    options=[
-                        ("grpc.max_send_message_length", 100 * 1024 * 1024),  # 100MB
-                        ("grpc.max_receive_message_length", 100 * 1024 * 1024),
-                    ]
+                    options=list(self.channel_options.items())
                 )
 
                 # Try to establish connection with a timeout
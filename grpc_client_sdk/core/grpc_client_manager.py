@@ -26,20 +26,25 @@ class GrpcClientManager:
     _logger = get_logger('framework.grpc_client_manager')
 
     @classmethod
-    def register_clients(cls, name: str, target: str) -> bool:
+    def register_clients(cls, name: str, target: str, channel_options: Optional[Dict[str, Any]] = None) -> bool:
         """
         Register a new gRPC client with specified name and target.
 
         :param name: Logical name of the client (e.g., "root", "username")
         :param target: host:port of the gRPC server (e.g., "localhost:50051")
+        :param channel_options: Optional channel arguments overriding GrpcClient.DEFAULT_CHANNEL_OPTIONS.
+                                Only applied when the client is first registered.
         :return: True if the client was successfully registered, False otherwise.
         """
         if name in cls._clients:
             cls._logger.info(f"Client '{name}' already registered.")
+            if channel_options:
+                cls._logger.warning(f"Client '{name}' already registered - ignoring channel_options {channel_options}. "
+                                    f"Call clear() first to re-create it with different options.")
             return True
 
         host, port = target.split(":")
-        client = GrpcClient(host=host, port=int(port))
+        client = GrpcClient(host=host, port=int(port), channel_options=channel_options)
 
         # Try to connect
         if not client.connect():
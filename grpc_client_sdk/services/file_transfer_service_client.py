@@ -93,7 +93,7 @@ class FileTransferServiceClient:
 
             stream = self.stub.DownloadFile(request)
 
-            content = bytearray()
+            chunks = []
             metadata_received = False
 
             for response in stream:
@@ -110,12 +110,15 @@ class FileTransferServiceClient:
                         f"File metadata received: {metadata.filename} ({metadata.file_size} bytes) - {download_type}")
 
                 elif response.HasField("chunk_data"):
-                    content.extend(response.chunk_data)
+                    chunks.append(response.chunk_data)
 
             if not metadata_received:
                 self.logger.error("No file metadata received during download.")
                 return None
 
+            # Join once: a single allocation instead of growing a bytearray and copying it to bytes
+            content = b"".join(chunks)
+
             # Log the actual received size
             actual_size = len(content)
             if tail_bytes and tail_bytes.isdigit():
@@ -129,7 +132,7 @@ class FileTransferServiceClient:
             else:
                 self.logger.info(f"Received {actual_size} bytes of file data")
 
-            return bytes(content)
+            return content
 
         except Exception as e:
             self.logger.error(f"Download failed for '{remote_path}': {e}")
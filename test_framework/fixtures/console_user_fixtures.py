@@ -1,8 +1,10 @@
 import pytest
-from typing import Optional, Dict, Any
-from test_framework.grpc_session.session_manager import GrpcSessionManager
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from test_framework.utils import get_logger
 
+if TYPE_CHECKING:
+    from test_framework.grpc_session.session_manager import GrpcSessionManager
+
 
 @pytest.fixture(scope="function")
 def console_user_tracker(test_config, request):
@@ -24,13 +26,15 @@ def console_user_tracker(test_config, request):
             self.station_id = station_id
             self._grpc_manager = None
         
-        def _get_grpc_manager(self) -> GrpcSessionManager:
+        def _get_grpc_manager(self) -> "GrpcSessionManager":
             """
             Get or create GrpcSessionManager for console state queries.
             
             :return: GrpcSessionManager instance for console queries
             """
             if self._grpc_manager is None:
+                from test_framework.grpc_session.session_manager import GrpcSessionManager
+
                 self._grpc_manager = GrpcSessionManager(
                     station_id=self.station_id, 
                     logger=self.logger,
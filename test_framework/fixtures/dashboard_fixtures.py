@@ -0,0 +1,42 @@
+"""
+Performance dashboard fixtures: one SQLite-backed dashboard manager per test session.
+
+Environment variables:
+- PERFORMANCE_DB_PATH  # SQLite database path (default: C:\\performance-data\\performance.db)
+"""
+import os
+
+import pytest
+
+from test_framework.utils import get_logger
+
+PERFORMANCE_DB_PATH = r"C:\performance-data\performance.db"
+
+
+@pytest.fixture(scope="session")
+def dashboard_manager():
+    """
+    Session-scoped PerformanceDashboardManager sharing one pooled SQLite connection across tests.
+    The HTML dashboard and summary are produced once at session end instead of after every measurement.
+
+    Usage:
+        dashboard_manager.measure_and_track_timing(..., generate_dashboard=False)
+    """
+    from test_framework.utils.handlers.dashboard_handler import PerformanceDashboardManager
+
+    logger = get_logger("performance_dashboard")
+    manager = PerformanceDashboardManager(
+        logger=logger,
+        use_sqlite=True,
+        db_path=os.environ.get("PERFORMANCE_DB_PATH", PERFORMANCE_DB_PATH)
+    )
+
+    yield manager
+
+    dashboard_file = manager.generate_html_dashboard()
+    if dashboard_file:
+        logger.info(f"Performance dashboard ready: {dashboard_file}")
+    else:
+        logger.error("Failed to generate performance dashboard")
+    logger.info(manager.generate_dashboard_summary())
+    manager.close()
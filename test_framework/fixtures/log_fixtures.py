@@ -0,0 +1,288 @@
+"""
+Log file fixtures: download the remote log from the macOS endpoint and parse it for analysis.
+
+Command line options:
+- --no-log-download  # reuse the last downloaded log artifact instead of downloading a new one;
+                       tests that need a fresh log (fresh_log_file, download_log_file) are skipped
+
+Supported markers:
+- @pytest.mark.log_tail_bytes(262144)  # bytes to download from the end of the log
+- @pytest.mark.log_artifact_name("imprivata.log")  # local artifact file name
+"""
+import os
+import time
+from datetime import datetime
+from typing import Optional
+
+import pytest
+
+from test_framework.utils.consts.constants import REMOTE_LOG_NAME
+from test_framework.utils.logger_settings.logger_config import LoggerConfig
+
+
+def pytest_addoption(parser):
+    parser.addoption("--no-log-download", action="store_true", default=False,
+                     help="Skip downloading fresh logs; use the last downloaded log artifact "
+                          "and skip tests that need a fresh log")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "log_tail_bytes(size): number of bytes to download from the end of the log file")
+    config.addinivalue_line("markers", "log_artifact_name(name): local file name for the downloaded log artifact")
+
+
+# Default number of bytes downloaded from the end of the remote log file
+LOG_TAIL_BYTES = "2097152"
+
+# Downloaded log files for the current run, keyed by (remote log path, tail bytes, artifact name)
+_log_file_cache = {}
+
+
+def _get_log_tail_bytes(request) -> str:
+    """Resolve the log tail size from @pytest.mark.log_tail_bytes(size), defaulting to LOG_TAIL_BYTES."""
+    marker = request.node.get_closest_marker("log_tail_bytes")
+    if marker and marker.args:
+        return str(marker.args[0])
+    return LOG_TAIL_BYTES
+
+
+def _get_log_artifact_name(request) -> str:
+    """Resolve the local artifact file name from @pytest.mark.log_artifact_name(name), defaulting to REMOTE_LOG_NAME."""
+    marker = request.node.get_closest_marker("log_artifact_name")
+    if marker and marker.args:
+        return marker.args[0]
+    return REMOTE_LOG_NAME
+
+
+def _get_cached_log_artifact(request, artifact_name: str, test_logger) -> Optional[str]:
+    """
+    Return the last downloaded log artifact when --no-log-download is set.
+    Skips the test if no artifact has been downloaded yet.
+
+    :return: Local path of the cached artifact, or None if downloading is enabled
+    """
+    if not request.config.getoption("--no-log-download"):
+        return None
+
+    cached_path = os.path.join(LoggerConfig.initialize().DOWNLOADS_DIR, artifact_name)
+    if not os.path.exists(cached_path):
+        pytest.skip(f"--no-log-download set and no cached log artifact found at '{cached_path}'")
+
+    test_logger.info(f"Log download disabled, using cached artifact: '{cached_path}'")
+    return cached_path
+
+
+def _skip_if_log_download_disabled(request):
+    """Skip the test when --no-log-download is set, since it needs a log written during the test."""
+    if request.config.getoption("--no-log-download"):
+        pytest.skip("--no-log-download set and this test needs a freshly downloaded log")
+
+
+def _has_entry_since(content: bytes, expected_bytes: bytes, since: Optional[datetime]) -> bool:
+    """
+    Check whether the log content has a line containing expected_bytes timestamped at or after since.
+    Without since, any occurrence of expected_bytes matches.
+    """
+    if since is None:
+        return expected_bytes in content
+
+    from test_framework.utils.handlers.file_analyzer.timestamps import parse_log_timestamp
+
+    index = content.find(expected_bytes)
+    while index != -1:
+        line_start = content.rfind(b"\n", 0, index) + 1
+        prefix = content[line_start:index].lstrip()[:23]
+        line_time = parse_log_timestamp(prefix.decode("ascii", "replace"))
+        if line_time is not None and line_time >= since:
+            return True
+        line_end = content.find(b"\n", index)
+        if line_end == -1:
+            return False
+        index = content.find(expected_bytes, line_end)
+    return False
+
+
+def _download_log_file(session_context, log_file_path, test_logger, tail_bytes: str = LOG_TAIL_BYTES,
+                       artifact_name: str = REMOTE_LOG_NAME, timeout: float = 10.0,
+                       expected_text: str = None, since: Optional[datetime] = None) -> str:
+    """
+    Download the remote log file and save it to artifacts.
+    Polls the endpoint with exponential backoff until the file has content and,
+    if requested, until that content has a line with the expected text timestamped at or after since.
+
+    :param session_context: Session context used for the file transfer
+    :param log_file_path: Path of the log file on the macOS endpoint
+    :param test_logger: Logger instance for the current test
+    :param tail_bytes: Number of bytes to download from the end of the log file
+    :param artifact_name: File name used for the saved artifact
+    :param timeout: Maximum time in seconds to wait for the log file
+    :param expected_text: Optional text the downloaded content should contain
+    :param since: Optional earliest timestamp of the line containing expected_text
+    :return: Local path of the saved log file
+    :raises RuntimeError: If the log cannot be downloaded or the expected entry never appears
+    """
+    # Imported lazily so collecting tests that never download logs stays cheap
+    from test_framework.utils.handlers.execution_artifacts.artifacts_handler import save_to_artifacts
+
+    test_logger.info("Downloading log file from macOS endpoint")
+    expected_bytes = expected_text.encode("utf-8") if expected_text else None
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    entry_found = True
+
+    while True:
+        file_content = session_context.root_context.file_transfer.download_file(
+            log_file_path,
+            tail_bytes=tail_bytes
+        )
+        if file_content and (expected_bytes is None or _has_entry_since(file_content, expected_bytes, since)):
+            break
+        if time.monotonic() + delay >= deadline:
+            if not file_content:
+                raise RuntimeError(f"Failed to download log file from '{log_file_path}'")
+            entry_found = False
+            break
+        time.sleep(delay)
+        delay = min(delay * 2, 2.0)
+
+    test_logger.info(f"Downloaded {len(file_content)} bytes from log file")
+
+    # Save content to local file for analysis
+    local_log_path = save_to_artifacts(file_content, artifact_name)
+    test_logger.info(f"Log file saved in: '{local_log_path}'")
+
+    if not entry_found:
+        since_text = f" at or after {since}" if since else ""
+        raise RuntimeError(f"'{expected_text}' not found{since_text} in log file within {timeout}s "
+                           f"(last download saved in '{local_log_path}')")
+
+    _log_file_cache[(log_file_path, tail_bytes, artifact_name)] = local_log_path
+    return local_log_path
+
+
+@pytest.fixture(scope="function")
+def prepare_log_file(test_config, test_logger, request):
+    """
+    Fixture to download, save, and prepare the log file from the macOS endpoint for analysis.
+    The download is cached for the rest of the run, so read-only log tests share one copy.
+    The gRPC session is only resolved when a download is actually needed.
+    """
+    artifact_name = _get_log_artifact_name(request)
+    cached_artifact = _get_cached_log_artifact(request, artifact_name, test_logger)
+    if cached_artifact:
+        return cached_artifact
+
+    log_file_path = test_config['log_file_path']
+    tail_bytes = _get_log_tail_bytes(request)
+    cached_path = _log_file_cache.get((log_file_path, tail_bytes, artifact_name))
+    if cached_path:
+        test_logger.info(f"Using cached log file: '{cached_path}'")
+        return cached_path
+
+    _, session_context = request.getfixturevalue("session_manager")
+    return _download_log_file(session_context, log_file_path, test_logger, tail_bytes=tail_bytes,
+                              artifact_name=artifact_name)
+
+
+@pytest.fixture(scope="function")
+def fresh_log_file(test_config, test_logger, request):
+    """
+    Fixture that always downloads a new copy of the log file, bypassing the cache.
+    Use it in tests that verify log entries generated during the test itself.
+    Skipped when --no-log-download is set.
+    """
+    _skip_if_log_download_disabled(request)
+    artifact_name = _get_log_artifact_name(request)
+
+    _, session_context = request.getfixturevalue("session_manager")
+    return _download_log_file(session_context, test_config['log_file_path'], test_logger,
+                              tail_bytes=_get_log_tail_bytes(request), artifact_name=artifact_name)
+
+
+@pytest.fixture(scope="function")
+def download_log_file(test_config, test_logger, request):
+    """
+    Fixture that provides a callable to download a new copy of the log file on demand.
+    Use it when the log must be fetched after an action performed inside the test body.
+    Skipped when --no-log-download is set.
+
+    Usage:
+        log_path = download_log_file(expected_text="sessionDidBecomeActive", since=tap_time)
+    """
+    _skip_if_log_download_disabled(request)
+    tail_bytes = _get_log_tail_bytes(request)
+    artifact_name = _get_log_artifact_name(request)
+
+    def download(expected_text: str = None, timeout: float = 10.0, since: Optional[datetime] = None):
+        """
+        Download the log file, waiting up to timeout seconds for a line containing expected_text
+        timestamped at or after since. Raises RuntimeError if no such line appears in time.
+        """
+        _, session_context = request.getfixturevalue("session_manager")
+        return _download_log_file(session_context, test_config['log_file_path'], test_logger,
+                                  tail_bytes=tail_bytes, artifact_name=artifact_name,
+                                  timeout=timeout, expected_text=expected_text, since=since)
+
+    return download
+
+
+@pytest.fixture(scope="session")
+def log_extractor():
+    """
+    Session-wide LogExtractor, so its timestamp parse cache is shared by every test.
+
+    Usage:
+        entries = log_extractor.find_entries_containing(entries, "proxCard")
+    """
+    from test_framework.utils.handlers.file_analyzer.extractor import LogExtractor
+
+    return LogExtractor()
+
+
+@pytest.fixture(scope="session")
+def parse_log_file(log_extractor):
+    """
+    Fixture that provides a callable to parse a log file and return a LogExtractor and parsed entries.
+    Parsed entries are memoized per file path and reused while the file's modification time
+    and size are unchanged, so tests analyzing the same downloaded file share one parse.
+    Only the latest parse of each path is kept.
+
+    Usage:
+        data_extractor, entries = parse_log_file(log_path)
+        data_extractor, recent = parse_log_file(log_path, since=tap_time - timedelta(seconds=5))
+    """
+    from test_framework.utils.handlers.file_analyzer.parser import LogParser
+
+    parser = LogParser()
+    data_extractor = log_extractor
+    parsed_files = {}  # path -> (mtime_ns, size, entries)
+
+    def parse(log_file_path, since: Optional[datetime] = None):
+        """
+        Parse the specified log file and return the extractor and entries.
+        When since is given, only entries timestamped at or after it are returned; if the
+        file has not been fully parsed yet, only that tail of the file is read.
+        """
+        stat = os.stat(log_file_path)
+        cached = parsed_files.get(log_file_path)
+        if cached and cached[:2] != (stat.st_mtime_ns, stat.st_size):
+            # The file was re-downloaded - drop the stale parse
+            del parsed_files[log_file_path]
+            cached = None
+
+        if since is not None:
+            if cached is None:
+                # Binary-search the file for the window instead of parsing the whole log
+                return data_extractor, parser.parse_file_since(log_file_path, since)
+            entries = [
+                entry for entry in cached[2]
+                if entry.timestamp and data_extractor._parse_timestamp(entry.timestamp) >= since
+            ]
+            return data_extractor, entries
+
+        if cached is None:
+            cached = (stat.st_mtime_ns, stat.st_size, parser.parse_file(log_file_path))
+            parsed_files[log_file_path] = cached
+        return data_extractor, cached[2]
+
+    return parse
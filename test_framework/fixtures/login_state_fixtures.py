@@ -2,7 +2,6 @@ import pytest
 import time
 from test_framework.login_state.login_manager import LoginManager
 from test_framework.login_state.applescript_logout import AppleScriptLogoutManager
-from test_framework.grpc_session.session_manager import GrpcSessionManager
 from test_framework.utils import get_logger
 
 
@@ -181,6 +180,8 @@ def login_state(test_config, request, console_user_tracker):
             else:
                 # Fallback: create new session manager/context
                 try:
+                    from test_framework.grpc_session.session_manager import GrpcSessionManager
+
                     grpc_manager = GrpcSessionManager(station_id=station_id, logger=logger)
                     session_timeout = test_config.get("session_timeout", 15)
                     session_context = grpc_manager.create_session(expected_user=target_user, timeout=session_timeout)
@@ -198,8 +199,7 @@ def login_state(test_config, request, console_user_tracker):
                     grpc_manager=grpc_manager,
                     expected_user=target_user,
                     max_attempts=3,
-                    retry_delay=2.0,
-                    verification_timeout=15
+                    total_timeout=15
                 )
                 if applescript_success:
                     self.logger.info(f"AppleScript logout successful for user: {target_user}")
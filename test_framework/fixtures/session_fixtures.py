@@ -1,11 +1,39 @@
 import pytest
-from test_framework.grpc_session.session_manager import GrpcSessionManager
+from typing import TYPE_CHECKING
 from test_framework.utils import get_logger
 import time
 
+if TYPE_CHECKING:
+    from test_framework.grpc_session.session_manager import GrpcSessionManager
+
+
+@pytest.fixture(scope="session")
+def grpc_session_managers():
+    """
+    Session-wide pool of GrpcSessionManager instances keyed by station ID.
+
+    Root gRPC clients, registry and command service wrappers are built once per station
+    and rebound to each test by the function-scoped session fixtures.
+    """
+    return {}
+
+
+def _get_session_manager(pool, station_id: str, logger, test_name: str) -> "GrpcSessionManager":
+    """Get the pooled GrpcSessionManager for a station, rebound to the current test."""
+    # Imported lazily so collecting the suite does not load grpc and the protobuf stubs
+    from test_framework.grpc_session.session_manager import GrpcSessionManager
+
+    manager = pool.get(station_id)
+    if manager is None:
+        manager = GrpcSessionManager(station_id=station_id, logger=logger, test_context=test_name)
+        pool[station_id] = manager
+    else:
+        manager.bind_test_context(test_name, logger)
+    return manager
+
 
 @pytest.fixture(scope="function")
-def session_manager(test_config, request):
+def session_manager(test_config, request, grpc_session_managers):
     """
     Session manager fixtures that provides a GrpcSessionManager and SessionContext.
 
@@ -21,11 +49,7 @@ def session_manager(test_config, request):
 
     expected_user = test_config.get("expected_user")
     login_timeout = test_config.get("session_timeout", 10)
-    manager = GrpcSessionManager(
-        station_id=test_config["station_id"],
-        logger=logger,
-        test_context=test_name
-    )
+    manager = _get_session_manager(grpc_session_managers, test_config["station_id"], logger, test_name)
     logger.info(f"Creating session for user: {expected_user} on station: {test_config['station_id']}")
     session_context = None
 
@@ -54,7 +78,7 @@ def session_manager(test_config, request):
 
 
 @pytest.fixture(scope="function")
-def lightweight_session(test_config, request):
+def lightweight_session(test_config, request, grpc_session_managers):
     """
     Lightweight session manager fixture for quick session creation without delays.
     
@@ -71,11 +95,7 @@ def lightweight_session(test_config, request):
 
     expected_user = test_config.get("expected_user")
     login_timeout = test_config.get("session_timeout", 10)
-    manager = GrpcSessionManager(
-        station_id=test_config["station_id"],
-        logger=logger,
-        test_context=test_name
-    )
+    manager = _get_session_manager(grpc_session_managers, test_config["station_id"], logger, test_name)
     logger.info(f"Creating lightweight session for user: {expected_user} on station: {test_config['station_id']}")
     session_context = None
 
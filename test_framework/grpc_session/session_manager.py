@@ -43,6 +43,20 @@ class GrpcSessionManager:
         self.root_command = CommandServiceClient(client_name="root", logger=self.logger)
         self._session_context: Optional[SessionContext] = None
 
+    def bind_test_context(self, test_context: str, logger: Optional[logging.Logger] = None):
+        """
+        Rebind this manager to a new test so it can be reused across tests.
+        The root clients and channels are kept; only per-test identity and session state are reset.
+
+        :param test_context: Test name used for correlated logging
+        :param logger: Optional logger instance for the new test
+        """
+        self.test_context = test_context
+        self.logger = logger or get_logger(f"test.{test_context}.session.{self.station_id}")
+        self.root_registry.logger = self.logger
+        self.root_command.logger = self.logger
+        self._session_context = None
+
     def create_session(self, expected_user: str, timeout: int = None) -> SessionContext:
         """
         Create a gRPC session for the expected user.
@@ -98,9 +112,9 @@ class GrpcSessionManager:
     def _wait_for_agent_login(self, username: str, timeout: int, poll_interval: float = 1.0) -> int:
         """Wait for user login and return agent port."""
         self.logger.info(f"Waiting for user '{username}' to log in...")
-        deadline = time.time() + timeout
+        deadline = time.monotonic() + timeout
 
-        while time.time() < deadline:
+        while time.monotonic() < deadline:
             try:
                 agents = self.root_registry.list_agents()
                 usernames = [agent["username"] for agent in agents]
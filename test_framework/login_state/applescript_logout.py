@@ -15,6 +15,11 @@ class AppleScriptLogoutManager:
         logger (Logger): Logger instance for logout operations.
     """
 
+    # Backoff delays (seconds) slept before each retry attempt; later retries reuse the last one
+    RETRY_DELAYS = (0.5, 2.0)
+    # Interval (seconds) between console state checks during verification
+    VERIFY_POLL_INTERVAL = 0.1
+
     def __init__(self, logger=None):
         """
         Initialize the AppleScript logout manager.
@@ -24,40 +29,51 @@ class AppleScriptLogoutManager:
         self.logger = logger or get_logger("applescript_logout")
 
     def logout_user(self, session_context, grpc_manager, expected_user: str,
-                    max_attempts: int = 3, retry_delay: float = 2.0,
-                    verification_timeout: int = 15) -> bool:
+                    max_attempts: int = 3, total_timeout: float = 15.0) -> bool:
         """
-        Perform user logout using AppleScript with retry logic and verification.
+        Perform user logout using AppleScript with exponential backoff and verification.
         This method executes AppleScript logout commands and verifies the operation
-        completed successfully by checking console user state.
+        completed successfully by checking console user state. Only failed AppleScript
+        executions are retried; once a logout command succeeds, verification gets the
+        whole remaining budget and returns as soon as the console user changes.
         
         :param session_context: Session context for AppleScript execution
         :param grpc_manager: gRPC manager for logout verification
         :param expected_user: Username that should be logged out
         :param max_attempts: Maximum number of retry attempts
-        :param retry_delay: Delay in seconds between retry attempts
-        :param verification_timeout: Timeout in seconds for logout verification
+        :param total_timeout: Total time budget in seconds for all attempts and verification
         :return: True if logout completed and verified successfully
         """
-        self.logger.info(f"Starting AppleScript logout for user '{expected_user}' (max attempts: {max_attempts})")
+        self.logger.info(f"Starting AppleScript logout for user '{expected_user}' "
+                         f"(max attempts: {max_attempts}, budget: {total_timeout}s)")
+        deadline = time.monotonic() + total_timeout
 
         for attempt in range(max_attempts):
+            if attempt > 0:
+                delay = self.RETRY_DELAYS[min(attempt - 1, len(self.RETRY_DELAYS) - 1)]
+                if time.monotonic() + delay >= deadline:
+                    break
+                self.logger.info(f"Retrying in {delay} seconds...")
+                time.sleep(delay)
+
             self.logger.info(f"AppleScript logout attempt {attempt + 1}/{max_attempts}")
 
             if self._execute_applescript_logout(session_context, expected_user):
-                if self._verify_logout(grpc_manager, expected_user, verification_timeout):
+                # The session is already closing - re-running the script would fail, so wait it out
+                remaining = max(deadline - time.monotonic(), 0.0)
+                if self._verify_logout(grpc_manager, expected_user, remaining):
                     self.logger.info(f"AppleScript logout completed successfully for user '{expected_user}'")
                     return True
-                else:
-                    self.logger.warning(f"AppleScript logout verification failed on attempt {attempt + 1}")
-            else:
-                self.logger.warning(f"AppleScript logout execution failed on attempt {attempt + 1}")
+                self.logger.error(f"AppleScript logout for user '{expected_user}' was not verified "
+                                  f"within {total_timeout}s budget")
+                return False
 
-            if attempt < max_attempts - 1:
-                self.logger.info(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
+            self.logger.warning(f"AppleScript logout execution failed on attempt {attempt + 1}")
 
-        self.logger.error(f"All {max_attempts} AppleScript logout attempts failed")
+            if time.monotonic() >= deadline:
+                break
+
+        self.logger.error(f"AppleScript logout failed for user '{expected_user}' within {total_timeout}s budget")
         return False
 
     def _execute_applescript_logout(self, session_context, expected_user: str) -> bool:
@@ -131,7 +147,7 @@ class AppleScriptLogoutManager:
             self.logger.error(f"Logout with confirmation exception: {e}")
             return False
 
-    def _verify_logout(self, grpc_manager, expected_user: str, timeout: int) -> bool:
+    def _verify_logout(self, grpc_manager, expected_user: str, timeout: float) -> bool:
         """
         Verify logout operation completed by checking console user state.
         This method polls the console user state to confirm the expected user
@@ -143,9 +159,9 @@ class AppleScriptLogoutManager:
         :return: True if logout verified successfully
         """
         self.logger.info(f"Verifying logout for user: {expected_user}...")
-        deadline = time.time() + timeout
+        deadline = time.monotonic() + timeout
 
-        while time.time() < deadline:
+        while True:
             try:
                 current_state = grpc_manager.get_logged_in_users()
                 console_user = current_state.get("console_user", "")
@@ -153,11 +169,13 @@ class AppleScriptLogoutManager:
                 if console_user != expected_user:
                     self.logger.info(f"Logout verified - user changed from '{expected_user}' to '{console_user}'")
                     return True
-
-                time.sleep(1.0)
             except Exception as e:
-                self.logger.error(f"Logout verification failed: {e}")
-                return False
+                # The agent can drop calls while the session closes, so keep polling until the deadline
+                self.logger.warning(f"Console state check failed during logout verification: {e}")
+
+            if time.monotonic() + self.VERIFY_POLL_INTERVAL >= deadline:
+                break
+            time.sleep(self.VERIFY_POLL_INTERVAL)
 
         self.logger.warning(f"Logout verification timed out - user may still be '{expected_user}'")
         return False
\ No newline at end of file
@@ -220,9 +220,9 @@ class TappingManager:
 
     def _verify_logout(self, expected_user: str, grpc_session_manager, timeout: int) -> bool:
         """Verify logout occurred by checking logged-in users."""
-        deadline = time.time() + timeout
+        deadline = time.monotonic() + timeout
 
-        while time.time() < deadline:
+        while time.monotonic() < deadline:
             try:
                 user_info = grpc_session_manager.get_logged_in_users()
                 console_user = user_info.get("console_user", "")
@@ -19,7 +19,7 @@ import json
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from test_framework.utils import get_logger
-from test_framework.utils.handlers.dashboard_handler import JsonDataHandler
+from test_framework.utils.handlers.dashboard_handler.json_data_handler import JsonDataHandler
 from test_framework.utils.handlers.dashboard_handler.database_handler import PerformanceDatabase, \
     PerformanceDatabaseError
 
@@ -128,8 +128,14 @@ class PerformanceDashboardManager:
             self.logger.error(f"All save methods failed: {e}")
             return None
 
-    def measure_and_track_timing(self, test_name: str, start_time, end_time, data_extractor, expected_user: str = None) -> str:
-        """Complete timing measurement and dashboard generation in one method."""
+    def measure_and_track_timing(self, test_name: str, start_time, end_time, data_extractor, expected_user: str = None,
+                                 generate_dashboard: bool = True) -> str:
+        """Complete timing measurement and dashboard generation in one method.
+
+        Args:
+            generate_dashboard: Render the HTML dashboard and summary now; pass False when the
+                dashboard is rendered once at the end of the session instead
+        """
         # Simple timing calculation
         if hasattr(end_time, 'timestamp'):
             session_time = data_extractor._parse_timestamp(end_time.timestamp)
@@ -158,6 +164,9 @@ class PerformanceDashboardManager:
             }
         )
 
+        if not generate_dashboard:
+            return f"{time_diff:.3f}s"
+
         # Generate dashboard and summary
         dashboard_file = self.generate_html_dashboard()
         if dashboard_file:
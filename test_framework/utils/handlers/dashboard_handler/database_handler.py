@@ -96,6 +96,9 @@ class PerformanceDatabase:
                     conn.row_factory = sqlite3.Row
                     conn.execute("PRAGMA foreign_keys = ON")
                     conn.execute("PRAGMA journal_mode = WAL")
+                    # WAL is crash-safe with NORMAL sync; avoids an fsync per commit
+                    conn.execute("PRAGMA synchronous = NORMAL")
+                    conn.execute("PRAGMA temp_store = MEMORY")
                     self._connection_pool[thread_id] = conn
 
                 connection = self._connection_pool[thread_id]
@@ -240,10 +243,10 @@ class PerformanceDatabase:
             with self.get_connection() as conn:
                 cursor = conn.execute(insert_sql, values)
                 record_id = cursor.lastrowid
-                conn.commit()
 
-                # Update statistics
+                # Update statistics in the same transaction
                 self._update_performance_stats(conn, test_data["test_name"])
+                conn.commit()
 
             self.logger.info(f"Saved performance result: {test_data['test_name']} (ID: {record_id})")
             return record_id
@@ -1,8 +1,11 @@
+import bisect
+import functools
 from datetime import datetime
-from typing import List, Tuple, Union
+from typing import Callable, Dict, List, Tuple, Union
 
 from test_framework.utils import get_logger
 from test_framework.utils.handlers.file_analyzer.entry import LogEntry
+from test_framework.utils.handlers.file_analyzer.timestamps import parse_log_timestamp
 
 
 class LogExtractor:
@@ -12,9 +15,16 @@ class LogExtractor:
         """Initialize the extractor."""
         self.logger = get_logger("framework.handler.log_extractor")
         self._logged_timestamp_errors = set()  # Track already logged timestamp errors
+        self._compiled_criteria = {}  # Criteria tuple -> predicate, see compile_criteria
+        # Log bursts repeat the same timestamp string; memoize parsing per extractor
+        self._parse_timestamp = functools.lru_cache(maxsize=8192)(self._parse_timestamp)
 
     def _parse_timestamp(self, timestamp_str: str) -> datetime:
-        """Parse timestamp string to datetime object."""
+        """Parse timestamp string to datetime object (memoized per instance, see __init__)."""
+        parsed_time = parse_log_timestamp(timestamp_str)
+        if parsed_time is not None:
+            return parsed_time
+
         timestamp_format = [
             "%Y-%m-%d %H:%M:%S.%f",
             "%Y-%m-%d %H:%M:%S",
@@ -56,6 +66,38 @@ class LogExtractor:
 
         return True
 
+    def compile_criteria(self, **criteria) -> Callable[[LogEntry], bool]:
+        """
+        Build a reusable predicate with the same semantics as _matches_criteria.
+        Patterns are lowercased once and the predicate is cached per criteria set.
+
+        :param criteria: Field name to case-insensitive substring pattern
+        :return: Callable that returns True if an entry matches all criteria
+
+        Usage:
+            is_session_active = extractor.compile_criteria(component="DesktopAgent", message="sessionDidBecomeActive")
+            active_entries = [entry for entry in entries if is_session_active(entry)]
+        """
+        key = tuple(sorted((field_name, str(pattern).lower()) for field_name, pattern in criteria.items()))
+        predicate = self._compiled_criteria.get(key)
+        if predicate is not None:
+            return predicate
+
+        missing = object()
+
+        def predicate(entry: LogEntry) -> bool:
+            for field_name, pattern_str in key:
+                field_value = getattr(entry, field_name, missing)
+                if field_value is missing:
+                    return False
+                field_str = str(field_value) if field_value is not None else ""
+                if pattern_str not in field_str.lower():
+                    return False
+            return True
+
+        self._compiled_criteria[key] = predicate
+        return predicate
+
     def find_entries_containing(self, entries: List[LogEntry], text: str,
                                 field: str = "message") -> List[LogEntry]:
         """
@@ -88,6 +130,34 @@ class LogExtractor:
         self.logger.info(f"Found {len(results)} entries containing '{text}' in {field}")
         return results
 
+    def find_entries_multi(self, entries: List[LogEntry], keywords: List[str],
+                           field: str = "message") -> Dict[str, List[LogEntry]]:
+        """
+        Find entries containing each of several keywords in a single pass.
+
+        :param entries: List of log entries to search
+        :param keywords: Texts to search for
+        :param field: Field to search in (default: "message")
+        :return: Dictionary mapping each keyword to its list of matching entries
+
+        Usage:
+            hits = extractor.find_entries_multi(entries, ["PIDC authenticating", "proxCard"])
+            card_entries = hits["proxCard"]
+        """
+        results = {keyword: [] for keyword in keywords}
+        search_texts = [(keyword, keyword.lower()) for keyword in keywords]
+
+        for entry in entries:
+            if hasattr(entry, field):
+                field_value = str(getattr(entry, field)).lower()
+                for keyword, search_text in search_texts:
+                    if search_text in field_value:
+                        results[keyword].append(entry)
+
+        for keyword, matches in results.items():
+            self.logger.info(f"Found {len(matches)} entries containing '{keyword}' in {field}")
+        return results
+
     def find_user_activity(self, entries: List[LogEntry], username: str) -> List[LogEntry]:
         """
         Find all log entries related to a specific user.
@@ -168,6 +238,43 @@ class LogExtractor:
         self.logger.info(f"Found {len(results)} entries in time range")
         return results
 
+    def find_entries_in_time_range_sorted(self, entries: List[LogEntry],
+                                          start_time: Union[str, datetime],
+                                          end_time: Union[str, datetime],
+                                          **criteria) -> List[LogEntry]:
+        """
+        Find entries within time range using binary search on time-ordered entries.
+        Only O(log n) timestamps are parsed; the matching window is returned as a slice.
+
+        :param entries: List of log entries, all timestamped and sorted by timestamp (as returned by
+                        LogParser); use find_entries_in_time_range for lists that may hold other entries
+        :param start_time: Start of the time range (inclusive)
+        :param end_time: End of the time range (inclusive)
+        :param criteria: Optional filters applied to entries inside the window
+        :return: List of matching entries
+
+        Usage:
+            test_window = extractor.find_entries_in_time_range_sorted(
+                entries, test_start_time, test_end_time
+            )
+        """
+        if isinstance(start_time, str):
+            start_time = self._parse_timestamp(start_time)
+        if isinstance(end_time, str):
+            end_time = self._parse_timestamp(end_time)
+
+        def entry_time(entry: LogEntry) -> datetime:
+            return self._parse_timestamp(entry.timestamp)
+
+        low = bisect.bisect_left(entries, start_time, key=entry_time)
+        high = bisect.bisect_right(entries, end_time, lo=low, key=entry_time)
+        results = entries[low:high]
+        if criteria:
+            results = [entry for entry in results if self._matches_criteria(entry, **criteria)]
+
+        self.logger.info(f"Found {len(results)} entries in time range")
+        return results
+
     def find_latest_entries(self, entries: List[LogEntry],
                             test_time: Union[str, datetime],
                             time_window_seconds: int = 30,
@@ -272,7 +379,7 @@ class LogExtractor:
         """
         Find the latest entry matching multiple criteria.
 
-        :param entries: List of log entries to search
+        :param entries: List of log entries to search, in log order
         :param message_contains: Text that must be in the message
         :param component: Component name to match
         :param entry_type: Entry type to match (Info, Debug, Error, etc.)
@@ -299,19 +406,20 @@ class LogExtractor:
         if process_name:
             criteria["process_name"] = process_name
 
-        # Filter by criteria first
-        matching_entries = self.filter_entries(entries, **criteria)
-
-        # Then filter by message if specified
-        if message_contains:
-            matching_entries = self.filter_entries(matching_entries, message=message_contains)
+        # Entries are in log (time) order, so the first match from the end is the latest
+        matches = self.compile_criteria(**criteria)
+        index = next((i for i in range(len(entries) - 1, -1, -1) if matches(entries[i])), None)
 
-        if not matching_entries:
+        if index is None:
             return None
 
-        # Find latest entry
-        latest_entry = max(matching_entries,
-                           key=lambda x: self._parse_timestamp(x.timestamp) if x.timestamp else datetime.min)
+        # Among matches sharing the latest timestamp, return the earliest in the log
+        latest_entry = entries[index]
+        for i in range(index - 1, -1, -1):
+            if entries[i].timestamp != latest_entry.timestamp:
+                break
+            if matches(entries[i]):
+                latest_entry = entries[i]
 
         self.logger.info(f"Found latest entry matching criteria: {latest_entry.timestamp} - {latest_entry.message}")
-        return latest_entry
\ No newline at end of file
+        return latest_entry
@@ -1,13 +1,19 @@
+import mmap
+import os
 import re
+from datetime import datetime
 from typing import List, Optional
 
 from test_framework.utils import get_logger
 from test_framework.utils.handlers.file_analyzer.entry import LogEntry
+from test_framework.utils.handlers.file_analyzer.timestamps import parse_log_timestamp
 
 
 class LogParser:
     """Parser for macOS log files."""
 
+    TIMESTAMP_LENGTH = 23  # "YYYY-MM-DD HH:MM:SS.mmm"
+
     def __init__(self):
         """Initialize the file_analyzer."""
         self.logger = get_logger("framework.handler.log_parser")
@@ -26,6 +32,9 @@ class LogParser:
             r'(.*)'  # message
         )
 
+        # Byte-level timestamp check so lines that cannot match are never decoded
+        self.timestamp_prefix = re.compile(rb'\d{4}-\d{2}-\d{2}\s\d{2}:\d{2}:\d{2}\.\d{3}')
+
     def parse_line(self, line: str, line_number: int = 0) -> Optional[LogEntry]:
         """
         Parse a single line of log text.
@@ -35,7 +44,8 @@ class LogParser:
         :return: LogEntry object if parsing succeeds, None otherwise
         """
         try:
-            match = self.pattern.match(line.strip())
+            line = line.strip()
+            match = self.pattern.match(line)
             if not match:
                 return None
 
@@ -54,7 +64,7 @@ class LogParser:
                 process_name=process_name,
                 type=type_value,
                 message=message,
-                raw_line=line.strip(),
+                raw_line=line,
                 line_number=line_number
             )
         except Exception as e:
@@ -72,24 +82,89 @@ class LogParser:
         entries = []
 
         try:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    for i, line in enumerate(f, 1):
-                        if line.strip():
-                            entry = self.parse_line(line, i)
-                            if entry:
-                                entries.append(entry)
-                self.logger.info(f"Successfully parsed {len(entries)} log entries with utf-8 encoding")
-            except UnicodeDecodeError:
-                self.logger.warning(f"utf-8 decoding failed, retrying with latin-1 encoding for file: {file_path}")
-                with open(file_path, 'r', encoding='latin-1') as f:
-                    for i, line in enumerate(f, 1):
-                        if line.strip():
-                            entry = self.parse_line(line, i)
+            # Read bytes and decode only lines that start with a timestamp
+            with open(file_path, 'rb') as f:
+                for i, raw in enumerate(f, 1):
+                    if self.timestamp_prefix.match(raw.lstrip()):
+                        entry = self.parse_line(self._decode_line(raw), i)
+                        if entry:
+                            entries.append(entry)
+            self.logger.info(f"Successfully parsed {len(entries)} log entries")
+            return entries
+        except Exception as e:
+            self.logger.error(f"Error parsing file: {str(e)}")
+            return []
+
+    def parse_file_since(self, file_path: str, since: datetime) -> List[LogEntry]:
+        """
+        Parse only the lines of a time-ordered log file timestamped at or after a given time.
+        The memory-mapped file is binary-searched by byte offset for the first such line,
+        so everything written before it is never decoded or parsed.
+
+        :param file_path: Path to the log file
+        :param since: Earliest timestamp to include
+        :return: List of LogEntry objects from the first line at or after since to the end of file
+        """
+        self.logger.info(f"Parsing entries since {since} from log file: {file_path}")
+        entries = []
+
+        try:
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return entries
+
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    offset = self._find_offset_since(mm, since)
+                    line_number = mm[:offset].count(b'\n') + 1
+
+                    for i, raw in enumerate(mm[offset:].split(b'\n'), line_number):
+                        if self.timestamp_prefix.match(raw.lstrip()):
+                            entry = self.parse_line(self._decode_line(raw), i)
                             if entry:
                                 entries.append(entry)
-                self.logger.info(f"Successfully parsed {len(entries)} log entries with latin-1 encoding")
+
+            self.logger.info(f"Successfully parsed {len(entries)} log entries since {since}")
             return entries
         except Exception as e:
             self.logger.error(f"Error parsing file: {str(e)}")
-            return []
\ No newline at end of file
+            return []
+
+    def _find_offset_since(self, mm: mmap.mmap, since: datetime) -> int:
+        """
+        Binary-search a memory-mapped log for the start of the first line timestamped at or after since.
+        Lines without a leading timestamp are skipped over while probing.
+        """
+        low, high = 0, len(mm)
+
+        while low < high:
+            mid = (low + high) // 2
+            line_start = mm.rfind(b'\n', 0, mid) + 1
+
+            # Probe the first timestamped line at or after mid's line
+            position = line_start
+            line_time = None
+            while position < high:
+                line_time = self._line_timestamp(mm, position)
+                if line_time is not None:
+                    break
+                position = mm.find(b'\n', position) + 1 or high
+
+            if line_time is None or line_time >= since:
+                high = line_start
+            else:
+                low = mm.find(b'\n', position) + 1 or len(mm)
+
+        return low
+
+    def _line_timestamp(self, mm: mmap.mmap, line_start: int) -> Optional[datetime]:
+        """Parse the timestamp at the start of the line beginning at line_start."""
+        prefix = mm[line_start:line_start + self.TIMESTAMP_LENGTH]
+        return parse_log_timestamp(prefix.decode('ascii', 'replace'))
+
+    @staticmethod
+    def _decode_line(raw: bytes) -> str:
+        """Decode a raw log line as utf-8, falling back to latin-1."""
+        try:
+            return raw.decode('utf-8')
+        except UnicodeDecodeError:
+            return raw.decode('latin-1')
@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Optional
+
+
+def parse_log_timestamp(timestamp_str: str) -> Optional[datetime]:
+    """
+    Parse a "YYYY-MM-DD HH:MM:SS.mmm" log timestamp by slicing instead of strptime.
+
+    :param timestamp_str: Timestamp string from a log entry
+    :return: Parsed datetime, or None if the string is not in this exact format
+    """
+    if (len(timestamp_str) != 23 or timestamp_str[4] != '-' or timestamp_str[7] != '-'
+            or timestamp_str[10] != ' ' or timestamp_str[13] != ':' or timestamp_str[16] != ':'
+            or timestamp_str[19] != '.'):
+        return None
+    try:
+        return datetime(int(timestamp_str[0:4]), int(timestamp_str[5:7]), int(timestamp_str[8:10]),
+                        int(timestamp_str[11:13]), int(timestamp_str[14:16]), int(timestamp_str[17:19]),
+                        int(timestamp_str[20:23]) * 1000)
+    except ValueError:
+        return None
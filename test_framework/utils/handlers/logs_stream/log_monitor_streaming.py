@@ -12,6 +12,7 @@ from dataclasses import dataclass
 
 from test_framework.utils import get_logger
 from test_framework.utils.handlers.file_analyzer.entry import LogEntry
+from test_framework.utils.handlers.file_analyzer.timestamps import parse_log_timestamp
 
 
 @dataclass
@@ -36,6 +37,9 @@ class LogMonitorStreaming:
     occur, with sophisticated filtering and automatic timeout/cleanup handling.
     """
 
+    # Number of trailing entries from the previous poll used to find where new entries start
+    SCAN_ANCHOR_SIZE = 8
+
     def __init__(self, logs_monitor_service, log_file_path: str, test_logger=None):
         """
         Initialize streaming-based log monitor.
@@ -115,11 +119,16 @@ class LogMonitorStreaming:
         Wait for entries matching criteria with timeout.
 
         Monitors the stream until we find enough matching entries or timeout.
+        Each poll only filters entries received since the previous poll, located by
+        the last entries scanned rather than by buffer length (see _entries_after).
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = start_time + criteria.timeout_seconds
         check_interval = 0.5  # Check every 500ms
+        matching_entries = []
+        scanned_tail = []
 
-        while time.time() - start_time < criteria.timeout_seconds:
+        while time.monotonic() < deadline:
             # Get current entries from stream
             active_streams = self.logs_monitor.get_active_streams()
 
@@ -130,34 +139,62 @@ class LogMonitorStreaming:
             stream_info = active_streams[stream_id]
             all_entries = stream_info.get('entries', [])
 
-            if not all_entries:
+            new_entries = self._entries_after(all_entries, scanned_tail)
+            if all_entries:
+                scanned_tail = all_entries[-self.SCAN_ANCHOR_SIZE:]
+
+            if not new_entries:
                 time.sleep(check_interval)
                 continue
 
-            # Filter entries by start time
-            relevant_entries = self._filter_by_time_range(all_entries, criteria.start_time)
+            # Filter new entries by start time
+            relevant_entries = self._filter_by_time_range(new_entries, criteria.start_time)
 
             if not relevant_entries:
                 time.sleep(check_interval)
                 continue
 
             # Apply additional filtering
-            matching_entries = self._apply_additional_filtering(relevant_entries, criteria)
+            matching_entries.extend(self._apply_additional_filtering(relevant_entries, criteria))
 
             # Check if we have enough matches
             if len(matching_entries) >= criteria.min_entries_required:
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 self.logger.info(f"Found {len(matching_entries)} matching entries after {elapsed:.2f}s")
                 return matching_entries
 
             time.sleep(check_interval)
 
         # Timeout reached
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
         self.logger.warning(
-            f"Timeout after {elapsed:.2f}s - found {len(matching_entries) if 'matching_entries' in locals() else 0} entries (needed {criteria.min_entries_required})")
+            f"Timeout after {elapsed:.2f}s - found {len(matching_entries)} entries (needed {criteria.min_entries_required})")
         return None
 
+    @staticmethod
+    def _entries_after(entries: List[LogEntry], scanned_tail: List[LogEntry]) -> List[LogEntry]:
+        """
+        Return the buffered entries received after scanned_tail, the last entries scanned.
+
+        The stream buffer may be capped (oldest entries dropped as new ones arrive) or reset,
+        so its length says nothing about how many entries are new. The position is found by
+        searching back from the end for scanned_tail as a run of consecutive entries, so a
+        repeated log line is not mistaken for the previous scan position. The run may be cut
+        off at the start of the buffer once older entries are dropped. If it is no longer
+        buffered, every buffered entry is treated as new.
+        """
+        if not scanned_tail:
+            return entries
+
+        for end in range(len(entries) - 1, -1, -1):
+            matched = 0
+            while (matched < len(scanned_tail) and matched <= end
+                   and entries[end - matched] == scanned_tail[-1 - matched]):
+                matched += 1
+            if matched == len(scanned_tail) or matched == end + 1:
+                return entries[end + 1:]
+        return entries
+
     def _filter_by_time_range(self, entries: List[LogEntry], start_time: datetime) -> List[LogEntry]:
         """Filter entries to only those after start_time."""
         relevant_entries = []
@@ -227,6 +264,10 @@ class LogMonitorStreaming:
 
     def _parse_timestamp(self, timestamp_str: str) -> datetime:
         """Parse timestamp string to datetime object."""
+        parsed_time = parse_log_timestamp(timestamp_str)
+        if parsed_time is not None:
+            return parsed_time
+
         timestamp_formats = [
             "%Y-%m-%d %H:%M:%S.%f",
             "%Y-%m-%d %H:%M:%S",
@@ -48,6 +48,9 @@ class LoggerManager:
         # Create enhanced context filter
         self.context_filter = EnhancedContextFilter()
 
+        # Loggers already returned by get_logger, keyed by name
+        self._loggers = {}
+
         # Set up logging system
         self._setup_logging()
 
@@ -133,6 +136,10 @@ class LoggerManager:
         :param name: The name of the logger.
         :return: A logger instance.
         """
+        logger = self._loggers.get(name)
+        if logger is not None:
+            return logger
+
         logger = logging.getLogger(name)
 
         # Ensure it has the enhanced context filter
@@ -140,6 +147,7 @@ class LoggerManager:
         if not has_filter:
             logger.addFilter(self.context_filter)
 
+        self._loggers[name] = logger
         return logger
 
     def set_test_case(self, name: str):
@@ -0,0 +1,27 @@
+"""
+Polling helpers for waiting on asynchronous system state.
+"""
+import time
+from typing import Callable
+
+
+def wait_until(predicate: Callable[[], bool], timeout: float = 10.0, interval: float = 0.2) -> bool:
+    """
+    Poll a condition until it becomes true or the timeout expires.
+    Returns as soon as the condition is observed instead of sleeping a fixed time.
+
+    :param predicate: Callable returning a truthy value once the condition is met
+    :param timeout: Maximum time in seconds to wait
+    :param interval: Delay in seconds between checks
+    :return: True if the condition was met within the timeout, False otherwise
+
+    Example:
+        assert wait_until(lambda: tracker.get_current_user() == "admin", timeout=5)
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if predicate():
+            return True
+        if time.monotonic() + interval > deadline:
+            return False
+        time.sleep(interval)
@@ -61,8 +61,7 @@ def test_applescript_logout_timing_validation(auth_manager, applescript_logout_m
                 grpc_manager=manager,
                 expected_user=expected_user,
                 max_attempts=3,
-                retry_delay=2.0,
-                verification_timeout=15
+                total_timeout=15
             )
             test_logger.info(f"✅ AppleScript logout completed: {applescript_success}")
         except Exception as e:
@@ -1,15 +1,22 @@
+from datetime import timedelta
+
 import pytest
 
 
 @pytest.mark.test_user("admin")
 def test_monitor_single_user_authentication(auth_manager, session_manager, test_logger, test_config, parse_log_file,
-                                            prepare_log_file):
+                                            download_log_file):
     """Test to verify single user authentication log entries."""
     expected_user = test_config["expected_user"]
     expected_card = test_config["expected_card"]
 
+    # Download the log written by the auth_manager login, not a copy cached earlier in the run
+    tap_time = auth_manager.get_last_tap_timestamp()
+    since = tap_time - timedelta(seconds=5) if tap_time else None
+    log_file_path = download_log_file(expected_text=f"Read card id: {expected_card}", since=since)
+
     # Parse logs to find session activity
-    data_extractor, entries = parse_log_file(prepare_log_file)
+    data_extractor, entries = parse_log_file(log_file_path)
     test_logger.info(f"Validating {len(entries)} log entries for session activity")
 
     # Initialize session manager and context
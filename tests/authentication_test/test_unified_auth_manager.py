@@ -41,6 +41,8 @@ def test_unified_auth_manager_operations(auth_manager, test_logger):
     user_2 = "macos_lab_1"  # Maps to test_user_2
     
     try:
+        mappings = auth_manager.get_user_mappings()
+
         # Test 1: Ensure clean state
         test_logger.info("Step 1: Ensuring logged out state")
         auth_manager.ensure_logged_out()
@@ -48,7 +50,7 @@ def test_unified_auth_manager_operations(auth_manager, test_logger):
         
         # Test 2: Login user 1 (if user mapping exists)
         test_logger.info(f"Step 2: Logging in {user_1}")
-        if user_1 in auth_manager.get_user_mappings():
+        if user_1 in mappings:
             success = auth_manager.login(user_1)
             test_logger.info(f"Login {user_1}: {'Success' if success else 'Failed'}")
             
@@ -60,7 +62,6 @@ def test_unified_auth_manager_operations(auth_manager, test_logger):
             test_logger.info(f"Skipping {user_1} login - no mapping configured")
         
         # Test 3: User switch (if both users have mappings)
-        mappings = auth_manager.get_user_mappings()
         if user_1 in mappings and user_2 in mappings:
             test_logger.info(f"Step 3: Switching from {user_1} to {user_2}")
             switch_success = auth_manager.switch_user(user_1, user_2)
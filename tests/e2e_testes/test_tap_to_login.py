@@ -1,15 +1,18 @@
 import os
-import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 
 import pytest
 
 from test_framework.utils.handlers.execution_artifacts.artifacts_handler import save_to_artifacts
+from test_framework.utils.polling import wait_until
 
 
 # @pytest.mark.test_user("macos_lab_1")
 @pytest.mark.auto_login(False)
-def test_complete_tap_to_login(login_state, session_manager, parse_log_file, prepare_log_file, test_config, test_logger):
+@pytest.mark.log_tail_bytes(262144)
+def test_complete_tap_to_login(login_state, session_manager, parse_log_file, download_log_file, test_config, test_logger):
     """
     Complete tap to login test - combines all verification steps using new framework
     """
@@ -30,8 +33,14 @@ def test_complete_tap_to_login(login_state, session_manager, parse_log_file, pre
     test_logger.info("STEP 2: Performing login tap and verifying using commands")
     login_state.ensure_logged_in(expected_user)
 
-    time.sleep(2)
-    result = session_context.root_context.command.get_logged_in_users()
+    result = None
+
+    def console_user_updated():
+        nonlocal result
+        result = session_context.root_context.command.get_logged_in_users()
+        return bool(result) and expected_user in result.get("console_user", "")
+
+    wait_until(console_user_updated, timeout=10)
     test_logger.info(f"Command execution result: {result}")
     assert result is not None, "Command result should not be None"
 
@@ -42,24 +51,28 @@ def test_complete_tap_to_login(login_state, session_manager, parse_log_file, pre
     # STEP 3: Verify user logged in using logs
     test_logger.info("STEP 3: Verifying user login using logs")
 
-    # Wait for log entries to be written
-    time.sleep(2)
+    # Download the log once this tap's card read entry has been written
+    tap_time = login_state.get_last_tap_timestamp()
+    since = tap_time - timedelta(seconds=5)
+    log_file_path = download_log_file(expected_text="proxCard", since=since)
 
-    # Parse logs to find authentication events we just generated
-    data_extractor, entries = parse_log_file(prepare_log_file)
+    # Parse only the log entries written around and after the login tap
+    data_extractor, entries = parse_log_file(log_file_path, since=since)
     test_logger.info(f"Parsed {len(entries)} log entries")
 
     # Search for authentication entries
     domain = test_config.get("domains", {}).get('PEGASUS', 'default_domain')
     auth_pattern = f'PIDC authenticating with domain: "{domain}" username: "{expected_user}"'
 
-    auth_entries = data_extractor.find_entries_containing(entries, "PIDC authenticating")
+    hits = data_extractor.find_entries_multi(entries, ["PIDC authenticating", "sessionDidBecomeActive", "proxCard"])
+
+    auth_entries = hits["PIDC authenticating"]
     if auth_entries:
         test_logger.info(f"Found {len(auth_entries)} authentication entries")
         data_extractor.log_messages(auth_entries, "Authentication Entries", limit=3)
 
     # Alternative check for session activation
-    session_entries = data_extractor.find_entries_containing(entries, "sessionDidBecomeActive")
+    session_entries = hits["sessionDidBecomeActive"]
     if session_entries:
         test_logger.info(f"Found {len(session_entries)} session activation entries")
 
@@ -67,7 +80,7 @@ def test_complete_tap_to_login(login_state, session_manager, parse_log_file, pre
     assert auth_entry_found, f"Required authentication log entry not found for user '{expected_user}'"
 
     # Search for card ID authentication entry
-    card_entries = data_extractor.find_entries_containing(entries, "proxCard")
+    card_entries = hits["proxCard"]
     card_entry_found = len(card_entries) > 0
     if card_entries:
         test_logger.info(f"Found {len(card_entries)} card authentication entries")
@@ -92,10 +105,11 @@ def test_complete_tap_to_login(login_state, session_manager, parse_log_file, pre
     applescript_output = script_result["stdout"]
     test_logger.info(f"AppleScript returned output: {applescript_output}")
 
-    # Extract user from "Log Out username" pattern
-    user_match = re.search(r'Log Out ([^â€¦]+)', applescript_output)
-    if user_match:
-        extracted_user = user_match.group(1)
+    # Extract user from the "Log Out username…" menu item
+    extracted_user = None
+    if "Log Out " in applescript_output:
+        extracted_user = applescript_output.split("Log Out ", 1)[1].split("\u2026", 1)[0].split(",", 1)[0].strip()
+    if extracted_user:
         test_logger.info(f"Extracted user from AppleScript: {extracted_user}")
         assert extracted_user.lower() == expected_user.lower()
     else:
@@ -105,49 +119,57 @@ def test_complete_tap_to_login(login_state, session_manager, parse_log_file, pre
     test_logger.info("User verification using AppleScript passed")
 
     # STEP 5: Verify user logged in using UI screenshot
-    test_logger.info("STEP 5: Verifying user login using UI screenshot")
-    apple_menu_script = '''tell application "System Events"
-        click menu bar item 1 of menu bar 1 of application process "Finder"
-    end tell'''
-
-    test_logger.debug(f"Executing AppleScript commands: {apple_menu_script}")
-    applescript_result = session_context.user_context.apple_script.run_applescript(
-        script=apple_menu_script
-    )
-    test_logger.info(f"AppleScript result: {applescript_result}")
-
-    screenshot = session_context.user_context.screen_capture.capture_screenshot(
-        capture_region=True,
-        region_x=0,
-        region_y=0,
-        region_width=400,
-        region_height=300,
-    )
-    assert screenshot is not None
-    assert screenshot.get("success") is True
-    assert screenshot.get("image_data") is not None
-
-    # Save image data to local file
-    local_path = save_to_artifacts(screenshot["image_data"], "applemenu_screenshot.png", subfolder="screenshots")
-
-    # Close the menu using AppleScript (press Escape)
-    test_logger.info("Closing Apple Menu using AppleScript...")
-    close_menu_script = '''
-    tell application "System Events"
-        key code 53
-    end tell
-    '''
-    close_menu_script_result = session_context.user_context.apple_script.run_applescript(script=close_menu_script)
-    test_logger.debug(f"AppleScript execution result: {close_menu_script_result}")
-    assert close_menu_script_result["success"] == True, "Failed to close Apple Menu"
-
-    assert os.path.exists(local_path), f"File not saved at {local_path}"
-
-    # # Extract text from the captured image data
-    # extracted_text = extract_text_from_image(local_path)
-    # test_logger.info(f"Extracted text from screenshot: {extracted_text}")
-    # assert extracted_text, "OCR extraction failed"
-    # assert expected_user.lower() in extracted_text.lower(), f"Expected user '{expected_user}' not found in OCR result"
+    # The screenshot is only consumed by OCR verification, so it is opt-in via ENABLE_OCR_VERIFY
+    if os.environ.get("ENABLE_OCR_VERIFY", "false").lower() == "true":
+        test_logger.info("STEP 5: Verifying user login using UI screenshot")
+        # Open the Apple menu, hold it open, then close it (Escape) in a single AppleScript call
+        apple_menu_script = '''tell application "System Events"
+            click menu bar item 1 of menu bar 1 of application process "Finder"
+            delay 1.0
+            key code 53
+        end tell'''
+
+        test_logger.debug(f"Executing AppleScript commands: {apple_menu_script}")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            menu_future = executor.submit(
+                session_context.user_context.apple_script.run_applescript,
+                script=apple_menu_script
+            )
+
+            # The remote AppleScript cannot report when the menu is open, so capture
+            # halfway through its 1s hold; the timing is best-effort
+            time.sleep(0.5)
+            test_logger.debug("Capturing Apple menu screenshot 0.5s after the click (best-effort timing)")
+            screenshot = session_context.user_context.screen_capture.capture_screenshot(
+                capture_region=True,
+                region_x=0,
+                region_y=0,
+                region_width=400,
+                region_height=300,
+            )
+            assert screenshot is not None
+            assert screenshot.get("success") is True
+            assert screenshot.get("image_data") is not None
+
+            # Save image data to local file while the AppleScript closes the menu
+            save_future = executor.submit(
+                save_to_artifacts, screenshot["image_data"], "applemenu_screenshot.png", subfolder="screenshots"
+            )
+            applescript_result = menu_future.result()
+            local_path = save_future.result()
+
+        test_logger.info(f"AppleScript result: {applescript_result}")
+        assert applescript_result["success"] == True, "Failed to open and close Apple Menu"
+
+        assert os.path.exists(local_path), f"File not saved at {local_path}"
+
+        # # Extract text from the captured image data
+        # extracted_text = extract_text_from_image(local_path)
+        # test_logger.info(f"Extracted text from screenshot: {extracted_text}")
+        # assert extracted_text, "OCR extraction failed"
+        # assert expected_user.lower() in extracted_text.lower(), f"Expected user '{expected_user}' not found in OCR result"
+    else:
+        test_logger.info("STEP 5: Skipping UI screenshot verification (set ENABLE_OCR_VERIFY=true to enable)")
 
     # Explicit cleanup at the end of the test
     test_logger.info("Cleaning up: logging out the latest logged-in user.")
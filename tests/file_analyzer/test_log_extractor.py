@@ -0,0 +1,59 @@
+from datetime import datetime
+
+import pytest
+
+from test_framework.utils.handlers.file_analyzer.extractor import LogExtractor
+from test_framework.utils.handlers.file_analyzer.parser import LogParser
+
+
+def _entry(time: str, message: str):
+    """Parse a DesktopAgent debug entry logged at the given time."""
+    return LogParser().parse_line(f"2025-03-01 {time} DesktopAgent Core 123 0x1a2b 0 456 admin debug: {message}")
+
+
+ENTRIES = [
+    _entry("10:00:00.000", "sessionDidBecomeActive first"),
+    _entry("10:00:01.000", "sessionDidBecomeActive second"),
+    _entry("10:00:01.000", "unrelated"),
+    _entry("10:00:01.000", "sessionDidBecomeActive third"),
+    _entry("10:00:02.000", "unrelated"),
+]
+
+
+def test_find_latest_entry_with_criteria_returns_first_of_latest_timestamp():
+    latest = LogExtractor().find_latest_entry_with_criteria(
+        ENTRIES, message_contains="sessiondidbecomeactive", component="desktopagent", process_name="ADMIN"
+    )
+
+    assert latest.message == "sessionDidBecomeActive second"
+
+
+def test_find_latest_entry_with_criteria_no_match():
+    assert LogExtractor().find_latest_entry_with_criteria(ENTRIES, message_contains="proxCard") is None
+
+
+@pytest.mark.parametrize("start_time, end_time, expected", [
+    # Both bounds are inclusive, including every entry sharing a bound's timestamp
+    (datetime(2025, 3, 1, 10, 0, 1), datetime(2025, 3, 1, 10, 0, 1), ENTRIES[1:4]),
+    (datetime(2025, 3, 1, 10, 0, 0), datetime(2025, 3, 1, 10, 0, 2), ENTRIES),
+    (datetime(2025, 3, 1, 10, 0, 0, 500000), datetime(2025, 3, 1, 10, 0, 1, 500000), ENTRIES[1:4]),
+    # Empty windows: between entries, before the first and after the last
+    (datetime(2025, 3, 1, 10, 0, 1, 200000), datetime(2025, 3, 1, 10, 0, 1, 800000), []),
+    (datetime(2025, 3, 1, 9, 0, 0), datetime(2025, 3, 1, 9, 59, 59), []),
+    (datetime(2025, 3, 1, 10, 0, 3), datetime.max, []),
+    # String bounds are parsed like entry timestamps
+    ("2025-03-01 10:00:01.000", "2025-03-01 10:00:02", ENTRIES[1:]),
+])
+def test_find_entries_in_time_range_sorted_bounds(start_time, end_time, expected):
+    extractor = LogExtractor()
+
+    assert extractor.find_entries_in_time_range_sorted(ENTRIES, start_time, end_time) == expected
+    assert extractor.find_entries_in_time_range(ENTRIES, start_time, end_time) == expected
+
+
+def test_find_entries_in_time_range_sorted_with_criteria():
+    window = LogExtractor().find_entries_in_time_range_sorted(
+        ENTRIES, datetime(2025, 3, 1, 10, 0, 1), datetime.max, message="sessionDidBecomeActive"
+    )
+
+    assert [entry.message for entry in window] == ["sessionDidBecomeActive second", "sessionDidBecomeActive third"]
@@ -0,0 +1,106 @@
+from datetime import datetime
+
+import pytest
+
+from test_framework.utils.handlers.file_analyzer.parser import LogParser
+
+
+def _log_line(timestamp: str, message: str) -> str:
+    """Build a log line in the macOS agent log format."""
+    return f"{timestamp} DeviceManager Reader 123 0x1a2b 0 456 root info: {message}"
+
+
+LINES = [
+    _log_line("2025-03-01 10:00:00.000", "first"),
+    _log_line("2025-03-01 10:00:01.000", "second"),
+    "    continuation of the second entry",
+    _log_line("2025-03-01 10:00:02.000", "third"),
+    _log_line("2025-03-01 10:00:03.000", "fourth"),
+]
+
+
+@pytest.fixture
+def parser():
+    return LogParser()
+
+
+def _write_log(tmp_path, lines, newline="\n", prefix="", trailing_newline=True):
+    """Write lines to a log file and return its path."""
+    content = prefix + newline.join(lines) + (newline if trailing_newline else "")
+    path = tmp_path / "agent.log"
+    path.write_bytes(content.encode("utf-8"))
+    return str(path)
+
+
+def _messages(entries):
+    return [entry.message for entry in entries]
+
+
+def test_parse_file_skips_lines_without_timestamp(parser, tmp_path):
+    entries = parser.parse_file(_write_log(tmp_path, LINES))
+
+    assert _messages(entries) == ["first", "second", "third", "fourth"]
+    assert [entry.line_number for entry in entries] == [1, 2, 4, 5]
+
+
+def test_parse_file_decodes_utf8_and_falls_back_to_latin1(parser, tmp_path):
+    path = tmp_path / "agent.log"
+    path.write_bytes(
+        _log_line("2025-03-01 10:00:00.000", "café").encode("utf-8") + b"\n"
+        + _log_line("2025-03-01 10:00:01.000", "caf").encode("ascii") + b"\xe9\n"
+    )
+
+    assert _messages(parser.parse_file(str(path))) == ["café", "café"]
+
+
+def test_parse_file_since_empty_file(parser, tmp_path):
+    path = tmp_path / "agent.log"
+    path.write_bytes(b"")
+
+    assert parser.parse_file_since(str(path), datetime(2025, 3, 1, 10, 0, 0)) == []
+
+
+@pytest.mark.parametrize("since, expected", [
+    (datetime(2025, 3, 1, 9, 0, 0), ["first", "second", "third", "fourth"]),
+    (datetime(2025, 3, 1, 10, 0, 0), ["first", "second", "third", "fourth"]),
+    (datetime(2025, 3, 1, 10, 0, 1), ["second", "third", "fourth"]),
+    (datetime(2025, 3, 1, 10, 0, 1, 500000), ["third", "fourth"]),
+    (datetime(2025, 3, 1, 10, 0, 3), ["fourth"]),
+    (datetime(2025, 3, 1, 11, 0, 0), []),
+])
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_parse_file_since_window(parser, tmp_path, since, expected, newline):
+    entries = parser.parse_file_since(_write_log(tmp_path, LINES, newline=newline), since)
+
+    assert _messages(entries) == expected
+
+
+def test_parse_file_since_line_numbers_match_parse_file(parser, tmp_path):
+    path = _write_log(tmp_path, LINES)
+
+    entries = parser.parse_file_since(path, datetime(2025, 3, 1, 10, 0, 2))
+
+    assert [entry.line_number for entry in entries] == [4, 5]
+
+
+def test_parse_file_since_partial_first_line(parser, tmp_path):
+    # Tail downloads usually start in the middle of a line
+    path = _write_log(tmp_path, LINES, prefix="0:59.999 DeviceManager Reader 123 0x1a2b 0 456 root info: cut\n")
+
+    assert _messages(parser.parse_file_since(path, datetime(2025, 3, 1, 9, 0, 0))) == \
+        ["first", "second", "third", "fourth"]
+    assert _messages(parser.parse_file_since(path, datetime(2025, 3, 1, 10, 0, 2))) == ["third", "fourth"]
+
+
+def test_parse_file_since_continuation_lines(parser, tmp_path):
+    lines = [LINES[0]] + [f"    continuation {i}" for i in range(50)] + LINES[1:]
+
+    entries = parser.parse_file_since(_write_log(tmp_path, lines), datetime(2025, 3, 1, 10, 0, 1))
+
+    assert _messages(entries) == ["second", "third", "fourth"]
+
+
+def test_parse_file_since_without_trailing_newline(parser, tmp_path):
+    path = _write_log(tmp_path, LINES, trailing_newline=False)
+
+    assert _messages(parser.parse_file_since(path, datetime(2025, 3, 1, 10, 0, 3))) == ["fourth"]
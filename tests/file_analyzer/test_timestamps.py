@@ -0,0 +1,32 @@
+from datetime import datetime
+
+import pytest
+
+from test_framework.utils.handlers.file_analyzer.extractor import LogExtractor
+from test_framework.utils.handlers.file_analyzer.timestamps import parse_log_timestamp
+
+
+def test_parse_log_timestamp():
+    assert parse_log_timestamp("2025-03-01 10:20:30.456") == datetime(2025, 3, 1, 10, 20, 30, 456000)
+
+
+@pytest.mark.parametrize("timestamp_str", [
+    "",
+    "2025-03-01 10:20:30",         # no milliseconds
+    "2025-03-01 10:20:30.456789",  # microseconds
+    "2025-03-01T10:20:30.456",     # ISO separator
+    "2025/03/01 10:20:30.456",
+    "2025-03-01 10:20:30,456",
+    "2025-13-01 10:20:30.456",     # right shape, invalid month
+    "2025-03-01 1a:20:30.456",
+])
+def test_parse_log_timestamp_rejects_other_formats(timestamp_str):
+    assert parse_log_timestamp(timestamp_str) is None
+
+
+@pytest.mark.parametrize("timestamp_str, expected", [
+    ("2025-03-01 10:20:30", datetime(2025, 3, 1, 10, 20, 30)),
+    ("2025-03-01 10:20:30.456789", datetime(2025, 3, 1, 10, 20, 30, 456789)),
+])
+def test_extractor_falls_back_to_strptime(timestamp_str, expected):
+    assert LogExtractor()._parse_timestamp(timestamp_str) == expected
@@ -0,0 +1,119 @@
+from types import SimpleNamespace
+
+import pytest
+
+from test_framework.login_state import applescript_logout
+from test_framework.login_state.applescript_logout import AppleScriptLogoutManager
+from test_framework.utils.scripts.applescripts import AppleScripts
+
+
+class FakeClock:
+    """Stands in for the time module so backoff and polling run instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class ScriptRunner:
+    """AppleScript runner double returning the queued results in order, then failing."""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.scripts = []
+
+    def run_applescript(self, script):
+        self.scripts.append(script)
+        return self.results.pop(0) if self.results else {"success": False, "error": "failed"}
+
+
+class ConsoleState:
+    """gRPC manager double returning the queued console states in order, then the last one."""
+
+    def __init__(self, states):
+        self.states = list(states)
+
+    def get_logged_in_users(self):
+        state = self.states.pop(0) if len(self.states) > 1 else self.states[0]
+        if isinstance(state, Exception):
+            raise state
+        return {"console_user": state}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(applescript_logout, "time", clock)
+    return clock
+
+
+def _session_context(runner):
+    return SimpleNamespace(user_context=SimpleNamespace(apple_script=runner))
+
+
+def test_logout_returns_once_console_user_changes(clock):
+    runner = ScriptRunner([{"success": True}])
+
+    logged_out = AppleScriptLogoutManager().logout_user(
+        _session_context(runner), ConsoleState(["admin", "admin", "loginwindow"]), "admin"
+    )
+
+    assert logged_out is True
+    assert runner.scripts == [AppleScripts.APPLESCRIPT_LOG_OUT_SIMPLE]
+    assert clock.sleeps == [AppleScriptLogoutManager.VERIFY_POLL_INTERVAL] * 2
+
+
+def test_logout_retries_failed_execution(clock):
+    # First attempt: simple and confirmation scripts both fail; second attempt succeeds
+    runner = ScriptRunner([{"success": False}, {"success": False}, {"success": True}])
+
+    logged_out = AppleScriptLogoutManager().logout_user(
+        _session_context(runner), ConsoleState(["loginwindow"]), "admin"
+    )
+
+    assert logged_out is True
+    assert runner.scripts == [
+        AppleScripts.APPLESCRIPT_LOG_OUT_SIMPLE,
+        AppleScripts.APPLESCRIPT_LOG_OUT_WITH_CONFIRM,
+        AppleScripts.APPLESCRIPT_LOG_OUT_SIMPLE,
+    ]
+    assert clock.sleeps == [AppleScriptLogoutManager.RETRY_DELAYS[0]]
+
+
+def test_logout_stops_retrying_when_budget_is_exhausted(clock):
+    runner = ScriptRunner([])
+
+    logged_out = AppleScriptLogoutManager().logout_user(
+        _session_context(runner), ConsoleState(["admin"]), "admin", total_timeout=1.0
+    )
+
+    # The 2s backoff before the third attempt does not fit in the remaining budget
+    assert logged_out is False
+    assert len(runner.scripts) == 4
+    assert clock.sleeps == [AppleScriptLogoutManager.RETRY_DELAYS[0]]
+
+
+def test_logout_fails_when_console_user_never_changes(clock):
+    runner = ScriptRunner([{"success": True}])
+
+    logged_out = AppleScriptLogoutManager().logout_user(
+        _session_context(runner), ConsoleState(["admin"]), "admin", total_timeout=1.0
+    )
+
+    assert logged_out is False
+    assert runner.scripts == [AppleScripts.APPLESCRIPT_LOG_OUT_SIMPLE]
+    assert clock.now <= 1.0
+
+
+def test_verify_logout_keeps_polling_after_transient_error(clock):
+    console = ConsoleState(["admin", ConnectionError("agent restarting"), "loginwindow"])
+
+    assert AppleScriptLogoutManager()._verify_logout(console, "admin", timeout=5.0) is True
+    assert len(clock.sleeps) == 2
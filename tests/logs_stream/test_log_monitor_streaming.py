@@ -0,0 +1,65 @@
+from datetime import datetime
+
+from test_framework.utils.handlers.file_analyzer.parser import LogParser
+from test_framework.utils.handlers.logs_stream.log_monitor_streaming import EventCriteria, LogMonitorStreaming
+
+
+def _entry(second: int, message: str):
+    return LogParser().parse_line(
+        f"2025-03-01 10:00:{second:02d}.000 DesktopAgent Core 123 0x1a2b 0 456 admin debug: {message}"
+    )
+
+
+class CappedStreamService:
+    """Logs monitoring service double whose stream buffer keeps only the newest entries."""
+
+    def __init__(self, polls, capacity=3):
+        self.polls = iter(polls)
+        self.capacity = capacity
+        self.buffer = []
+
+    def get_active_streams(self):
+        self.buffer = (self.buffer + next(self.polls, []))[-self.capacity:]
+        return {"stream-1": {"entries": list(self.buffer)}}
+
+
+def test_wait_for_matching_entries_with_capped_buffer():
+    # The buffer is full after the first poll, so its length never changes again
+    service = CappedStreamService([
+        [_entry(0, "idle"), _entry(1, "idle"), _entry(2, "idle")],
+        [_entry(3, "idle")],
+        [_entry(4, "sessionDidBecomeActive")],
+    ])
+    monitor = LogMonitorStreaming(service, "/Library/Logs/imprivata.log")
+    criteria = EventCriteria(
+        start_time=datetime(2025, 3, 1, 10, 0, 0),
+        target_patterns=["sessionDidBecomeActive"],
+        message_contains=["sessionDidBecomeActive"],
+        timeout_seconds=5,
+    )
+
+    matches = monitor._wait_for_matching_entries("stream-1", criteria)
+
+    assert [entry.message for entry in matches] == ["sessionDidBecomeActive"]
+
+
+def test_entries_after_finds_last_scanned_entries():
+    entries = [_entry(second, "idle") for second in range(4)]
+
+    assert LogMonitorStreaming._entries_after(entries, []) == entries
+    assert LogMonitorStreaming._entries_after(entries, entries[:2]) == entries[2:]
+    assert LogMonitorStreaming._entries_after(entries, entries) == []
+    # Older scanned entries were dropped from the buffer, the rest of the run still matches
+    assert LogMonitorStreaming._entries_after(entries[1:], entries[:2]) == entries[2:]
+    # Last scanned entries were dropped from the buffer - everything buffered is new
+    assert LogMonitorStreaming._entries_after(entries[2:], [_entry(0, "gone")]) == entries[2:]
+
+
+def test_entries_after_skips_repeated_last_line():
+    # The agent logs the same line again after another entry
+    scanned = [_entry(0, "idle"), _entry(1, "heartbeat")]
+    new_entries = [_entry(1, "sessionDidBecomeActive"), _entry(1, "heartbeat")]
+
+    assert LogMonitorStreaming._entries_after(scanned + new_entries, scanned) == new_entries
+    # Same with the buffer capped so the start of the scanned run is gone
+    assert LogMonitorStreaming._entries_after(scanned[1:] + new_entries, scanned) == new_entries
@@ -1,10 +1,11 @@
-import pytest
+from datetime import datetime, timedelta
 
-from test_framework.utils.handlers.dashboard_handler.dashboard_manager import PerformanceDashboardManager
+import pytest
 
 
 @pytest.mark.test_user("admin")
-def test_login_ui_performance(auth_manager, session_manager, parse_log_file, test_config, test_logger, prepare_log_file):
+def test_login_ui_performance(auth_manager, session_manager, parse_log_file, test_config, test_logger,
+                              download_log_file, dashboard_manager):
     """
     Test to measure the performance of the login UI process.
     """
@@ -17,13 +18,6 @@ def test_login_ui_performance(auth_manager, session_manager, parse_log_file, tes
     if expected_user in user_tap_mapping:
         test_logger.info(f"User tap endpoint: {user_tap_mapping[expected_user]}")
 
-    # Initialize with SQLite database for persistent performance tracking
-    dashboard_manager = PerformanceDashboardManager(
-        logger=test_logger,
-        use_sqlite=True,
-        db_path=r"C:\performance-data\performance.db"
-    )
-
     # Get tap timestamp from the auth manager fixtures
     tap_timestamp = auth_manager.get_last_tap_timestamp()
     test_logger.info(f"Login tap timestamp: {tap_timestamp}")
@@ -36,30 +30,28 @@ def test_login_ui_performance(auth_manager, session_manager, parse_log_file, tes
     # Verify the session was created for the expected user
     assert session_context.username == expected_user, f"Session created for wrong user. Expected: {expected_user}, Got: {session_context.username}"
 
-    # Parse logs to find session activity
-    data_extractor, entries = parse_log_file(prepare_log_file)
-    test_logger.info(f"Validating {len(entries)} log entries for session activity")
-
-
     # Filter entries to only those AFTER the tap timestamp to avoid old sessions
     # Add small buffer (3 seconds before) to account for log writing delays and timing precision
-    from datetime import timedelta
     buffer_time = tap_timestamp - timedelta(seconds=3)
-    filtered_entries = [
-        entry for entry in entries
-        if entry.timestamp and data_extractor._parse_timestamp(entry.timestamp) >= buffer_time
-    ]
+
+    # Download the log once this login's session activation entry has been written
+    log_file_path = download_log_file(expected_text="sessionDidBecomeActive", since=buffer_time)
+
+    # Parse logs to find session activity
+    data_extractor, entries = parse_log_file(log_file_path)
+    test_logger.info(f"Validating {len(entries)} log entries for session activity")
+
+    filtered_entries = data_extractor.find_entries_in_time_range_sorted(entries, buffer_time, datetime.max)
     test_logger.info(f"Filtered to {len(filtered_entries)} entries after {buffer_time} (3s before tap)")
     
     # Find recent entries for this user to ensure we get the current session
-    recent_user_entries = [
-        entry for entry in filtered_entries
-        if hasattr(entry, 'process_name') and entry.process_name == expected_user
-    ]
+    # (same case-insensitive substring match as the criteria search below)
+    is_user_entry = data_extractor.compile_criteria(process_name=expected_user)
+    recent_user_entries = [entry for entry in filtered_entries if is_user_entry(entry)]
     test_logger.info(f"Found {len(recent_user_entries)} recent entries for user {expected_user}")
     
     session_activity = data_extractor.find_latest_entry_with_criteria(
-        filtered_entries,
+        recent_user_entries,
         message_contains="sessionDidBecomeActive",
         component="DesktopAgent",
         entry_type="debug",
@@ -68,14 +60,15 @@ def test_login_ui_performance(auth_manager, session_manager, parse_log_file, tes
 
     assert session_activity is not None, "No 'sessionDidBecomeActive' entry found"
 
-    # Measure timing and generate dashboard in one call
+    # Record timing; the dashboard fixture renders the HTML dashboard once at session end
     if tap_timestamp:
         timing_result = dashboard_manager.measure_and_track_timing(
             test_name="session_activity_timing",
             start_time=tap_timestamp,
             end_time=session_activity,
             data_extractor=data_extractor,
-            expected_user=expected_user
+            expected_user=expected_user,
+            generate_dashboard=False
         )
         test_logger.info(f"Performance timing recorded: {timing_result}")
 
@@ -88,10 +81,3 @@ def test_login_ui_performance(auth_manager, session_manager, parse_log_file, tes
                 test_logger.info(f"Database size: {db_info['file_size_mb']:.2f} MB")
         except Exception as e:
             test_logger.warning(f"Could not retrieve database info: {e}")
-
-        # Generate final dashboard
-        dashboard_file = dashboard_manager.generate_html_dashboard()
-        if dashboard_file:
-            test_logger.info(f"Performance dashboard ready: {dashboard_file}")
-        else:
-            test_logger.error("Failed to generate performance dashboard")
\ No newline at end of file